@@ -1,27 +1,47 @@
-from collections.abc import Iterator
-from typing import TYPE_CHECKING, Any, Literal, get_args
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import IO, TYPE_CHECKING, Any, Literal, Self, get_args
+import os
+import re
 import subprocess
 import sys
-from argparse import ArgumentParser
+from abc import ABC, abstractmethod
+from argparse import ArgumentParser, ArgumentTypeError
 from pathlib import Path
 import webbrowser
-import tempfile
 import shutil
 import zipfile
 import json
+import math
+import struct
+from xml.sax.saxutils import escape
 
 try:
-    from PIL import Image
-    from PIL.ExifTags import Base, IFD, GPS
+    from PIL import Image, JpegImagePlugin
+    from PIL.ExifTags import GPS
+except (ModuleNotFoundError, ImportError):
+    pass
+
+try:
+    import orjson
 except (ModuleNotFoundError, ImportError):
     pass
 
 if TYPE_CHECKING:
-    from PIL import Image
-    from PIL.ExifTags import Base, IFD, GPS
+    from PIL import Image, JpegImagePlugin
+    from PIL.ExifTags import GPS
+    import orjson
 
 
 HAS_PIL = 'PIL' in sys.modules
+HAS_ORJSON = 'orjson' in sys.modules
+
+if HAS_PIL:
+    # Register the common plugins now instead of on the first `Image.open`
+    Image.preinit()
 
 
 # Internal type aliases
@@ -29,7 +49,20 @@ type GPSInfo = dict[int, Any]
 type Latitude = float
 type Longitude = float
 type Coordinates = tuple[Latitude, Longitude]
-type PointInfo = list[tuple[Path, Coordinates, float, str]]
+type PointInfo = Iterable[Point]
+
+
+@dataclass(slots=True)
+class Point:
+    """A geotagged image, with the path strings every writer needs built once"""
+    path: Path
+    name: str
+    filepath: str
+    lat: Latitude
+    lon: Longitude
+    elev: float
+    timestamp: str
+
 
 # Literal options
 Service = Literal['google', 'osm', 'apple', 'bing']
@@ -38,6 +71,20 @@ Format = Literal['shp', 'kml']
 Formats: tuple[Format, ...] = get_args(Format)
 
 
+# DMS minute/second scale factors
+INV_60 = 1 / 60
+INV_3600 = 1 / 3600
+
+# Webmap URL templates
+URL_TEMPLATES: dict[Service, str] = {
+    'google': 'https://www.google.com/maps/search/?api=1&query={lat},{lon}',
+    'osm': 'https://www.openstreetmap.org/search?query={lat}%2F{lon}#map=13/{lat}/{lon}',
+    'apple': 'https://maps.apple.com/frame?center={lat}%252C{lon}',
+    'bing': 'https://www.bing.com/maps/search?style=r&q={lat}%2C+{lon}&lvl=16&style=r',
+}
+URL_FORMATTERS = {service: tmpl.format for service, tmpl in URL_TEMPLATES.items()}
+
+
 # File constants
 KML_HEADER = (
     '<?xml version="1.0" encoding="UTF-8"?>\n'
@@ -53,9 +100,90 @@ KML_FOOTER = (
     '</kml>\n'
 )
 
+# Buffer size used when copying images into a KMZ
+COPY_BUFSIZE = 4 * 1024 * 1024
+
+# Image extensions picked up from the target directory
+JPEG_RE = re.compile(r'\.jpe?g\Z', re.IGNORECASE)
+
+# EXIF/TIFF constants for the fast GPS reader
+JPEG_SOI = b'\xff\xd8'
+JPEG_APP1 = 0xFFE1
+JPEG_SOS = 0xFFDA
+EXIF_HEADER = b'Exif\x00\x00'
+TIFF_DATETIME = 0x0132
+TIFF_GPS_IFD = 0x8825
+# TIFF field type -> (struct code, byte size)
+TIFF_TYPES: dict[int, tuple[str, int]] = {
+    1: ('s', 1),  # BYTE
+    2: ('s', 1),  # ASCII
+    3: ('H', 2),  # SHORT
+    4: ('L', 4),  # LONG
+    5: ('L', 8),  # RATIONAL (2x LONG)
+    7: ('s', 1),  # UNDEFINED
+    9: ('l', 4),  # SLONG
+    10: ('l', 8),  # SRATIONAL (2x SLONG)
+    13: ('L', 4),  # IFD (offset stored as LONG)
+}
+
+# Extra entities for values used inside `"`-quoted XML attributes
+XML_ATTR_ENTITIES = {'"': '&quot;'}
+
+# KML indent levels
+IND1, IND2, IND3, IND4, IND5 = ('\t' * depth for depth in range(1, 6))
+
+# Per-image placemark, compiled into `render_placemark` as an f-string
+PLACEMARK_TMPL = (
+    # Placemark container
+    f'{IND1}<Placemark id="img_{{name}}">\n'
+        f'{IND2}<name>{{name}}</name>\n'
+
+    # Description/Image/Timestamp
+    f'{IND2}<description>\n'
+        f'{IND3}<![CDATA['
+            '<img '
+            'style="max-width:500px;" '
+            'src="{rel}"'
+            '>'
+        ']]>\n'
+    f'{IND2}</description>\n'
+    f'{IND2}<TimeStamp>\n'
+        f'{IND3}<when>{{ts}}</when>\n'
+    f'{IND2}</TimeStamp>\n'
+
+    # Style/Icon
+    f'{IND2}<Style>\n'
+        f'{IND3}<IconStyle>\n'
+            f'{IND4}<scale>2.5</scale>\n'
+            f'{IND4}<Icon>\n'
+                f'{IND5}<href>{{rel}}</href>\n'
+            f'{IND4}</Icon>\n'
+        f'{IND3}</IconStyle>\n'
+    f'{IND2}</Style>\n'
+
+    # Point
+    f'{IND2}<Point>\n'
+        f'{IND3}<gx:altitudeMode>clampToGround</gx:altitudeMode>\n'
+        f'{IND3}<coordinates>{{lon}},{{lat}},{{elev}}</coordinates>\n'
+    f'{IND2}</Point>\n'
+    f'{IND1}</Placemark>\n'
+)
+KML_HEADER_B = KML_HEADER.encode()
+KML_FOOTER_B = KML_FOOTER.encode()
+
+# GeoJSON is streamed one feature per line between these
+GEOJSON_HEADER_B = b'{"type":"FeatureCollection","features":[\n'
+GEOJSON_FOOTER_B = b'\n]}\n'
 
-def L(l: int) -> str:
-    return '\t'*l
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise ArgumentTypeError(f'expected a whole number, got {value!r}') from None
+    if number < 1:
+        raise ArgumentTypeError(f'must be at least 1, got {number}')
+    return number
 
 
 def _install_pillow():
@@ -82,11 +210,15 @@ def dms_to_dd(d: float, m: float, s: float, b: Literal['N', 'S', 'E', 'W']) -> f
         >>> dms_to_dd(95, 12, 100, 'E')
         95.22777777777777
     """
-    dd = float(d) + float(m) / 60 + float(s) / 3600
-    if b in 'NE':
-        return dd
-    else:
-        return -1 * dd
+    # Burst/time-lapse shots repeat the same coordinates, so cache on plain floats
+    # (PIL hands back `IFDRational` components)
+    return _dms_to_dd(float(d), float(m), float(s), b)
+
+
+@lru_cache(maxsize=4096)
+def _dms_to_dd(d: float, m: float, s: float, b: Literal['N', 'S', 'E', 'W']) -> float:
+    dd = d + m * INV_60 + s * INV_3600
+    return dd if b == 'N' or b == 'E' else -dd
 
 
 def write_url(img_path: Path, url: str):
@@ -95,102 +227,206 @@ def write_url(img_path: Path, url: str):
         u_file.write(f'URL={url}\n')
 
 
-def write_kml(out_file: Path, info: PointInfo) -> None:
-    with open(out_file, 'wt', encoding='utf-8') as kml:
-        kml.write(KML_HEADER)
-        kml.write(f'{L(1)}<name>{out_file.name}</name>\n')
-        
-        for img_path, (lat, lon), elev, timestamp in info:
-            _rel_path = img_path.relative_to(out_file.parent)
-            # Placemark container
-            kml.write(
-                f'{L(1)}<Placemark id="img_{img_path.name}">\n'
-                    f'{L(2)}<name>{img_path.name}</name>\n'
-            )
-            
-            # Description/Image/Timestamp
-            kml.write(
-                f'{L(2)}<description>\n'
-                    f'{L(3)}<![CDATA['
-                        '<img '
-                        'style="max-width:500px;" '
-                        f'src="{_rel_path}"'
-                        '>'
-                    ']]>\n'
-                f'{L(2)}</description>\n'
-                f'{L(2)}<TimeStamp>\n'
-                    f'{L(3)}<when>{timestamp}</when>\n'
-                f'{L(2)}</TimeStamp>\n'
-            )
+def render_kml_name(out_file: Path) -> bytes:
+    return f'{IND1}<name>{escape(out_file.name)}</name>\n'.encode()
 
-            # Style/Icon
-            kml.write(
-                f'{L(2)}<Style>\n'
-                    f'{L(3)}<IconStyle>\n'
-                        f'{L(4)}<scale>2.5</scale>\n'
-                        f'{L(4)}<Icon>\n'
-                            f'{L(5)}<href>{_rel_path}</href>\n'
-                        f'{L(4)}</Icon>\n'
-                    f'{L(3)}</IconStyle>\n'
-                f'{L(2)}</Style>\n'
-            )
-            
-            # Point
-            kml.write(
-                f'{L(2)}<Point>\n'
-                    f'{L(3)}<gx:altitudeMode>clampToGround</gx:altitudeMode>\n'
-                    f'{L(3)}<coordinates>{lon},{lat},{elev}</coordinates>\n'
-                f'{L(2)}</Point>\n'
-            )
-            kml.write(f'{L(1)}</Placemark>\n')
-        kml.write(KML_FOOTER)
+
+def _compile_placemark_renderer() -> Callable[[Point, str], bytes]:
+    """Compile `PLACEMARK_TMPL` into a single f-string function
+
+    The indents and tags become constants of one `BUILD_STRING`, so each point
+    only costs the escapes, the field lookups and one encode
+    """
+    src = (
+        'def render_placemark(point, rel_path):\n'
+        '    lat, lon, elev, ts = point.lat, point.lon, point.elev, point.timestamp\n'
+        '    name = escape(point.name, XML_ATTR_ENTITIES)\n'
+        '    rel = escape(rel_path, XML_ATTR_ENTITIES)\n'
+        '    ts = escape(ts)\n'
+        f'    return f{PLACEMARK_TMPL!r}.encode()\n'
+    )
+    namespace: dict[str, Any] = {
+        'escape': escape,
+        'XML_ATTR_ENTITIES': XML_ATTR_ENTITIES,
+    }
+    exec(compile(src, '<placemark>', 'exec'), namespace)
+    return namespace['render_placemark']
+
+
+render_placemark = _compile_placemark_renderer()
+
+
+def _nan_to_null(obj: Any) -> Any:
+    # orjson writes NaN/inf as `null`, `json` would write invalid `NaN` tokens
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _nan_to_null(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_nan_to_null(v) for v in obj]
+    return obj
+
+
+def _dumps(obj: Any) -> bytes:
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(
+        _nan_to_null(obj),
+        ensure_ascii=False,
+        separators=(',', ':'),
+        allow_nan=False,
+    ).encode('utf-8')
+
+
+class PointWriter(ABC):
+    """Base for output writers that receive one point at a time
+
+    Subclasses open `part_file` as `_out` in `__init__`, handle each point in
+    `write` and finish the file in `close`. The part file only replaces
+    `out_file` if the run completes, so a failed run never overwrites a good
+    output with a truncated one
+    """
+
+    _out: IO[Any] | zipfile.ZipFile
+
+    def __init__(self, out_file: Path) -> None:
+        self.out_file = out_file
+        self.part_file = out_file.with_name(f'{out_file.name}.part')
+
+    @abstractmethod
+    def write(self, point: Point) -> None: ...
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc: object) -> None:
+        if exc_type is None:
+            self.close()
+            os.replace(self.part_file, self.out_file)
+        else:
+            self._out.close()
+            self.part_file.unlink(missing_ok=True)
+
+
+class KMLWriter(PointWriter):
+    def __init__(self, out_file: Path) -> None:
+        super().__init__(out_file)
+        self._root = str(out_file.parent)
+        self._out = open(self.part_file, 'wb')
+        self._out.write(KML_HEADER_B)
+        self._out.write(render_kml_name(out_file))
+
+    def write(self, point: Point) -> None:
+        # Images normally sit next to the KML, so a string compare is enough
+        if os.path.dirname(point.path) == self._root:
+            rel_path = point.name
+        else:
+            rel_path = os.path.relpath(point.path, self._root)
+        self._out.write(render_placemark(point, rel_path))
+
+    def close(self) -> None:
+        self._out.write(KML_FOOTER_B)
+        self._out.close()
+
+
+class KMZWriter(PointWriter):
+    def __init__(self, out_file: Path) -> None:
+        super().__init__(out_file)
+        kml = out_file.with_suffix('.kml')
+        self._kml_name = kml.name
+        # Images are streamed into the archive as they arrive, the KML text is
+        # kept in memory and added once all placemarks are known
+        self._chunks = [KML_HEADER_B, render_kml_name(kml)]
+        # JPEGs are already compressed, so only deflate the KML text
+        self._out = zipfile.ZipFile(
+            self.part_file, 'w', compression=zipfile.ZIP_STORED
+        )
+
+    def write(self, point: Point) -> None:
+        arcname = f'files/{point.name}'
+        self._chunks.append(render_placemark(point, arcname))
+        # `ZipFile.write` copies in 8KiB chunks, stream with a larger buffer
+        img_info = zipfile.ZipInfo.from_file(point.path, arcname)
+        img_info.compress_type = zipfile.ZIP_STORED
+        with open(point.path, 'rb') as src, self._out.open(img_info, 'w') as dst:
+            shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+
+    def close(self) -> None:
+        self._chunks.append(KML_FOOTER_B)
+        self._out.writestr(
+            self._kml_name,
+            b''.join(self._chunks),
+            compress_type=zipfile.ZIP_DEFLATED,
+        )
+        self._out.close()
+
+
+class GeoJSONWriter(PointWriter):
+    def __init__(self, out_file: Path) -> None:
+        super().__init__(out_file)
+        self._out = open(self.part_file, 'wb')
+        self._out.write(GEOJSON_HEADER_B)
+        self._sep = b''
+
+    def write(self, point: Point) -> None:
+        feature = {
+            'type': 'Feature',
+            'geometry': {
+                'type': 'Point',
+                'coordinates': [point.lon, point.lat, point.elev]
+            },
+            'properties': {
+                'timestamp': point.timestamp,
+                'filepath': point.filepath,
+            }
+        }
+        self._out.write(self._sep + _dumps(feature))
+        self._sep = b',\n'
+
+    def close(self) -> None:
+        self._out.write(GEOJSON_FOOTER_B)
+        self._out.close()
+
+
+class CSVWriter(PointWriter):
+    def __init__(self, out_file: Path) -> None:
+        super().__init__(out_file)
+        self._out = open(self.part_file, 'wt', encoding='utf-8')
+        self._out.write('Name,Latitude,Longitude,Elevation,Timestamp,Filepath\n')
+
+    def write(self, point: Point) -> None:
+        self._out.write(
+            f'{point.name},{point.lat},{point.lon},{point.elev},'
+            f'{point.timestamp},{point.filepath}\n'
+        )
+
+    def close(self) -> None:
+        self._out.close()
+
+
+def _write_points(writer: PointWriter, info: PointInfo) -> None:
+    with writer:
+        for point in info:
+            writer.write(point)
+
+
+def write_kml(out_file: Path, info: PointInfo) -> None:
+    _write_points(KMLWriter(out_file), info)
 
 
 def write_kmz(out_file: Path, info: PointInfo) -> None:
-    with tempfile.TemporaryDirectory() as tmp:
-        kml = Path(tmp) / f'{out_file.stem}.kml'
-        files = Path(tmp) / 'files'
-        files.mkdir()
-        for img, *_ in info:
-            img_dest = files / img.name
-            shutil.copyfile(img, img_dest)
-        
-        kmz_info = [(files / i[0].name, *i[1:])for i in info]
-        write_kml(kml, kmz_info)
-        
-        with zipfile.ZipFile(out_file, 'w') as kmz:
-            kmz.write(kml, kml.relative_to(tmp))
-            for fl in files.iterdir():
-                kmz.write(fl, fl.relative_to(tmp))
+    _write_points(KMZWriter(out_file), info)
 
 
 def write_geojson(out_file: Path, info: PointInfo) -> None:
-    _json: dict[str, Any] = {
-        'type': 'FeatureCollection',
-        'features': [
-            {
-                'type': 'Feature',
-                'geometry': {
-                    'type': 'Point',
-                    'coordinates': [lon, lat, elev]
-                },
-                'properties': {
-                    'timestamp': timestamp,
-                    'filepath': str(img),
-                }
-            }
-            for img, (lat, lon), elev, timestamp in info
-        ],
-    }
-    with open(out_file, 'wt', encoding='utf-8') as geojson:
-        json.dump(_json, geojson, indent=2)
+    _write_points(GeoJSONWriter(out_file), info)
 
 
 def write_csv(out_file: Path, info: PointInfo) -> None:
-    with open(out_file, 'wt', encoding='utf-8') as csv:
-        csv.write('Name,Latitude,Longitude,Elevation,Timestamp,Filepath\n')
-        for img, (lat, lon), elev, timestamp in info:
-            csv.write(f'{img.name},{lat},{lon},{elev},{timestamp},{img.resolve()}\n')
+    _write_points(CSVWriter(out_file), info)
 
 
 def get_lat_lon_elev(gps_info: GPSInfo) -> tuple[Coordinates, float]:
@@ -207,30 +443,147 @@ def get_lat_lon_elev(gps_info: GPSInfo) -> tuple[Coordinates, float]:
 
 
 def format_url(lat: float, lon: float, service: Service = 'google') -> str:
-    match service:
-        case 'google':
-            return f'https://www.google.com/maps/search/?api=1&query={lat},{lon}'
-        case 'osm':
-            return f'https://www.openstreetmap.org/search?query={lat}%2F{lon}#map=13/{lat}/{lon}'
-        case 'apple':
-            return f'https://maps.apple.com/frame?center={lat}%252C{lon}'
-        case 'bing':
-            return f'https://www.bing.com/maps/search?style=r&q={lat}%2C+{lon}&lvl=16&style=r'
+    return URL_FORMATTERS[service](lat=lat, lon=lon)
 
 
 def open_url(url: str) -> None:
     webbrowser.open(url)
 
 
+def _read_exif_app1(img_path: Path) -> bytes | None:
+    """Walk the JPEG segment headers and return the TIFF payload of the EXIF APP1
+    segment without reading the rest of the file
+    """
+    with open(img_path, 'rb') as jpg:
+        if jpg.read(2) != JPEG_SOI:
+            raise ValueError(f'{img_path.name} is not a JPEG')
+        while True:
+            marker, length = struct.unpack('>HH', jpg.read(4))
+            if marker >> 8 != 0xFF:
+                raise ValueError(f'Invalid JPEG marker {marker:#x} in {img_path.name}')
+            if marker == JPEG_SOS:
+                return None
+            if marker == JPEG_APP1:
+                segment = jpg.read(length - 2)
+                if segment.startswith(EXIF_HEADER):
+                    return segment[len(EXIF_HEADER):]
+            else:
+                jpg.seek(length - 2, 1)
+
+
+def _read_ifd(tiff: bytes, offset: int, endian: str) -> dict[int, Any]:
+    """Decode all entries of the TIFF IFD at `offset` into a `{tag: value}` dict
+
+    Entries with a field type the reader doesn't know are kept as `None` so
+    callers can tell them apart from missing tags
+    """
+    ifd: dict[int, Any] = {}
+    (count,) = struct.unpack_from(f'{endian}H', tiff, offset)
+    for i in range(count):
+        entry = offset + 2 + i * 12
+        tag, typ, n = struct.unpack_from(f'{endian}HHL', tiff, entry)
+        if typ not in TIFF_TYPES:
+            ifd[tag] = None
+            continue
+        code, size = TIFF_TYPES[typ]
+        data = entry + 8
+        if n * size > 4:
+            (data,) = struct.unpack_from(f'{endian}L', tiff, data)
+        if data + n * size > len(tiff):
+            raise ValueError(f'IFD entry {tag:#x} points outside of the EXIF segment')
+
+        value: Any
+        if code == 's':
+            value = tiff[data : data + n]
+            if typ == 2:
+                value = value.rstrip(b'\x00').decode('ascii', 'replace')
+        elif size == 8:
+            nums = struct.unpack_from(f'{endian}{2 * n}{code}', tiff, data)
+            value = tuple(
+                num / den if den else float('nan')
+                for num, den in zip(nums[::2], nums[1::2])
+            )
+        else:
+            value = struct.unpack_from(f'{endian}{n}{code}', tiff, data)
+        if isinstance(value, tuple) and len(value) == 1:
+            value = value[0]
+        ifd[tag] = value
+    return ifd
+
+
+def _read_gps_fast(img_path: Path) -> GPSInfo | None:
+    """Read the GPS IFD and timestamp straight from the EXIF APP1 segment
+
+    Returns:
+        The same mapping as `get_geo_exif`, or `None` if the file could not be
+        parsed and PIL should be used instead
+    """
+    try:
+        tiff = _read_exif_app1(img_path)
+        if tiff is None:
+            return {}
+        match tiff[:2]:
+            case b'II':
+                endian = '<'
+            case b'MM':
+                endian = '>'
+            case _:
+                return None
+        magic, ifd0_offset = struct.unpack_from(f'{endian}HL', tiff, 2)
+        if magic != 0x2A:
+            return None
+        ifd0 = _read_ifd(tiff, ifd0_offset, endian)
+        if TIFF_GPS_IFD not in ifd0:
+            return {}
+        gps_offset = ifd0[TIFF_GPS_IFD]
+        if not isinstance(gps_offset, int):
+            return None
+        gps_info = _read_ifd(tiff, gps_offset, endian)
+    except (ValueError, struct.error):
+        return None
+    # A tag is there but couldn't be decoded, let PIL have a go instead of
+    # reporting the image as untagged
+    if None in gps_info.values():
+        return None
+    if TIFF_DATETIME in ifd0 and not isinstance(ifd0[TIFF_DATETIME], str):
+        return None
+    time_info = {TIFF_DATETIME: ifd0.get(TIFF_DATETIME)}
+    return (gps_info | time_info) if gps_info else {}
+
+
+def _open_image(img_path: Path) -> 'Image.Image':
+    # Open as a JPEG directly to skip format sniffing, misnamed files still
+    # go through the generic `Image.open`
+    try:
+        return JpegImagePlugin.JpegImageFile(img_path)
+    except SyntaxError:
+        return Image.open(img_path)
+
+
 def get_geo_exif(img_path: Path) -> GPSInfo:
-    exif = Image.open(img_path).getexif()
-    gps_info = exif.get_ifd(IFD.GPSInfo)
-    time_info = {Base.DateTime: exif.get(Base.DateTime)}
+    gps_info = _read_gps_fast(img_path)
+    if gps_info is not None:
+        return gps_info
+
+    with _open_image(img_path) as im:
+        exif = im.getexif()
+        # Only parse the GPS sub-IFD if IFD0 actually points to one
+        if TIFF_GPS_IFD not in exif:
+            return {}
+        gps_info = exif.get_ifd(TIFF_GPS_IFD)
+        time_info = {TIFF_DATETIME: exif.get(TIFF_DATETIME)}
     return (gps_info | time_info) if gps_info else {}
 
 
+def _iter_jpegs(folder: Path) -> Iterator[Path]:
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if JPEG_RE.search(entry.name) and entry.is_file():
+                yield Path(entry.path)
+
+
 def get_info(folder: Path) -> Iterator[tuple[Path, GPSInfo | None]]:
-    for img in folder.glob('*.jp*g'):
+    for img in _iter_jpegs(folder):
         yield img, get_geo_exif(img) or None
 
 
@@ -240,47 +593,67 @@ def main(
     open_: bool,
     w_url: bool,
     services: tuple[Service, ...],
+    workers: int,
     kml_name: str | None,
     kmz_name: str | None,
     geojson_name: str | None,
     csv_name: str | None,
 ):
-    _files: PointInfo = []
+    valid_services = tuple(s for s in services if s in Services)
     if w_url and verbose:
         print(f'writing urls for {services}...')
     if open_ and verbose:
         print(f'opening tabs for {services}...')
-    
-    for img, geo_info in get_info(directory):
-        if not geo_info:
-            continue
-        (lat, lon), elev = get_lat_lon_elev(geo_info)
-        _files.append((img, (lat, lon), elev, str(geo_info[Base.DateTime])))
-        if verbose:
-            print(f'{img.name}: {lat}, {lon}')
-        urls = {s: format_url(lat, lon, s) for s in services if s in Services}
-        for service, url in urls.items():
-            if open_:
-                webbrowser.open(url)
-            if w_url:
-                service_path = img.with_stem(f'{img.stem}_{service}')
-                write_url(service_path, url)
-    if kml_name is not None:
-        if verbose:
-            print('writing kml...')
-        write_kml((directory / kml_name).with_suffix('.kml'), _files)
-    if kmz_name is not None:
-        if verbose:
-            print('writing kmz...')
-        write_kmz((directory / kmz_name).with_suffix('.kmz'), _files)
-    if geojson_name is not None:
-        if verbose:
-            print('writing geojson...')
-        write_geojson((directory / geojson_name).with_suffix('.geojson'), _files)
-    if csv_name is not None:
-        if verbose:
-            print('writing csv...')
-        write_csv((directory / csv_name).with_suffix('.csv'), _files)
+
+    outputs: tuple[tuple[str | None, str, type[PointWriter]], ...] = (
+        (kml_name, '.kml', KMLWriter),
+        (kmz_name, '.kmz', KMZWriter),
+        (geojson_name, '.geojson', GeoJSONWriter),
+        (csv_name, '.csv', CSVWriter),
+    )
+    with ExitStack() as stack:
+        # Browser launches block on IPC, so hand them off and keep parsing
+        browser_pool = None
+        if open_:
+            browser_pool = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+
+        # Every output is fed as each image is parsed instead of collecting all points
+        writers: list[PointWriter] = []
+        for out_name, suffix, writer in outputs:
+            if out_name is None:
+                continue
+            if verbose:
+                print(f'writing {suffix[1:]}...')
+            out_file = (directory / out_name).with_suffix(suffix)
+            writers.append(stack.enter_context(writer(out_file)))
+
+        # Resolve the folder once, every image path is built from it
+        root = str(directory.resolve())
+        for img, geo_info in get_info(directory):
+            if not geo_info:
+                continue
+            (lat, lon), elev = get_lat_lon_elev(geo_info)
+            name = img.name
+            point = Point(
+                img,
+                name,
+                os.path.join(root, name),
+                lat,
+                lon,
+                elev,
+                str(geo_info[TIFF_DATETIME]),
+            )
+            for point_writer in writers:
+                point_writer.write(point)
+            if verbose:
+                print(f'{name}: {lat}, {lon}')
+            for service in valid_services:
+                url = format_url(lat, lon, service)
+                if browser_pool is not None:
+                    browser_pool.submit(open_url, url)
+                if w_url:
+                    service_path = img.with_stem(f'{img.stem}_{service}')
+                    write_url(service_path, url)
 
 
 if __name__ == '__main__':
@@ -321,6 +694,13 @@ if __name__ == '__main__':
         default=['google'],
         type=str,
     )
+    parser.add_argument(
+        '-w',
+        '--workers',
+        help='Number of threads used to open browser tabs with `--open`',
+        type=_positive_int,
+        default=4,
+    )
     out_group = parser.add_argument_group('Output file flags', 'Specify a name using `-n [NAME]` or -<flag> [NAME]')
     out_group.add_argument(
         '-k',
@@ -386,6 +766,7 @@ if __name__ == '__main__':
         # URL/Browser
         args.url,        
         services,
+        args.workers,
         
         name or args.kml,
         name or args.kmz,